@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Asyncio variant of the TigerController serial port abstraction.
+
+Requires the optional ``pyserial-asyncio`` package
+(``pip install tigerasi[async]``).
+"""
+import asyncio
+import logging
+
+from tigerasi.tiger_controller import TigerController
+
+try:
+    import serial_asyncio
+except ImportError:
+    serial_asyncio = None
+
+
+class AsyncTigerController:
+    """Asyncio Tiger Box Serial Port Abstraction.
+
+    Sends commands without blocking the caller's thread so stage control
+    can overlap with other event-loop work (camera grabs, analysis, etc).
+    The Tiger Box replies to commands in FIFO order, so a single reader
+    task matches each reply line to the oldest pending command.
+
+    .. code-block:: python
+
+        box = await AsyncTigerController.connect('COM4')
+        reply, _ = await asyncio.gather(box.send("W X\\r"), camera.grab())
+        await box.close()
+
+    """
+
+    BAUD_RATE = TigerController.BAUD_RATE
+
+    def __init__(self):
+        """Init internal state only. Use :meth:`connect` to create instances."""
+        if serial_asyncio is None:
+            raise ImportError("AsyncTigerController requires the "
+                              "pyserial-asyncio package. Install it with "
+                              "'pip install tigerasi[async]'.")
+        self.log = logging.getLogger(__name__)
+        self._reader = None
+        self._writer = None
+        self._reader_task = None
+        # FIFO of futures, one per in-flight command, oldest first.
+        self._pending = None
+
+    @classmethod
+    async def connect(cls, com_port: str):
+        """Open the serial port and start the reply reader task.
+
+        :param com_port: serial com port.
+        """
+        self = cls()
+        self._reader, self._writer = \
+            await serial_asyncio.open_serial_connection(url=com_port,
+                                                        baudrate=cls.BAUD_RATE)
+        self._pending = asyncio.Queue()
+        self._reader_task = asyncio.create_task(self._read_replies())
+        return self
+
+    async def _read_replies(self):
+        """Continuously match incoming reply lines to pending commands."""
+        while True:
+            try:
+                line = await self._reader.readuntil(b'\r\n')
+            except (asyncio.IncompleteReadError, asyncio.CancelledError):
+                break
+            future = await self._pending.get()
+            if not future.cancelled():
+                future.set_result(line.decode('ascii'))
+
+    async def send(self, cmd_str: str):
+        """Send a command and await its reply.
+
+        :param cmd_str: command string with parameters and the proper line
+            termination (usually '\r') to send to the tiger controller.
+        """
+        future = asyncio.get_running_loop().create_future()
+        await self._pending.put(future)
+        self.log.debug("Sending: %r", cmd_str)
+        self._writer.write(cmd_str.encode('ascii'))
+        await self._writer.drain()
+        reply = await future
+        self.log.debug("Reply: %r", reply)
+        TigerController.check_reply_for_errors(reply)
+        return reply
+
+    async def close(self):
+        """Stop the reader task and close the serial port."""
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            self._reader_task = None
+        if self._writer is not None:
+            self._writer.close()
+            await self._writer.wait_closed()
+            self._writer = None
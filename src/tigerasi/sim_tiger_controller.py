@@ -27,10 +27,22 @@ class SerialStub:
     def write(self, msg: bytes):
         pass
 
+    def flush(self):
+        pass
+
     @property
     def out_waiting(self):
         return 0
 
+    @property
+    def in_waiting(self):
+        return len(self.out_buffer)
+
+    def read(self, size: int = 1):
+        data = bytes(self.out_buffer[:size])
+        del self.out_buffer[:size]
+        return data
+
     def read_until(self, sep: bytes):
         # return anything that has been pushed into the reply buffer or
         # nothing.
@@ -61,12 +73,21 @@ class SimTigerController(TigerController):
         self.ser = SerialStub(com_port, None, None)
         self.log = logging.getLogger(__name__)
         self.skipped_replies = 0
+        self._status_pending = False
+        self._pipeline_parts = None
+        self._rx_buf = bytearray()
+        self._speed_cache = {}
+        self.skip_axis_validation = False
+        self._last_cmd_send_time = perf_counter()
 
         # Get the lettered axes: ['X', 'Y', 'Z', ...].
         self.build_config = build_config
         self.ordered_axes = build_config['Motor Axes']
         # Create O(1) lookup container.
-        self.axes = set(self.ordered_axes)
+        self.axes = frozenset(self.ordered_axes)
+        # Prebuilt default for methods that act on all lettered axes.
+        self._lettered_axes = tuple(ax for ax in self.ordered_axes
+                                    if not ax.isnumeric())
         self.sim_positions = {x.upper(): 0 for x in self.axes}
         self.sim_speeds = {x.upper(): DEFAULT_SPEED_MM_PER_SEC
                            for x in self.axes if not x.isnumeric()}
@@ -76,7 +97,7 @@ class SimTigerController(TigerController):
     def home(self, *axes: str, wait: bool = True):
         if not axes:
             # Default to all lettered axes.
-            axes = [ax for ax in self.ordered_axes if not ax.isnumeric()]
+            axes = self._lettered_axes
         for axis in axes:
             self.sim_positions[axis] = 0
         self.ser.push_to_out_buffer(b'\r\n')  # Fake reply.
@@ -93,6 +114,14 @@ class SimTigerController(TigerController):
         self.ser.push_to_out_buffer(b'\r\n')  # Fake reply.
         super().move_relative(wait=wait, **axes)
 
+    def move_axis_relative(self, axis: str, val: int, wait: bool = True):
+        axis = axis.upper()
+        if __debug__ and axis not in self.axes:
+            raise ValueError(f"Error. Axis '{axis}' does not exist.")
+        self.sim_positions[axis] += val  # Update simulated location.
+        self.ser.push_to_out_buffer(b'\r\n')  # Fake reply.
+        super().move_axis_relative(axis, val, wait=wait)
+
     @axis_check('wait')
     def move_absolute(self, wait: bool = True, **axes: int):
         """move the axes specified by the specified absolute amount
@@ -108,7 +137,7 @@ class SimTigerController(TigerController):
         axis_positions = {}
         if not args:
             # Default to all lettered axes.
-            args = [ax for ax in self.ordered_axes if not ax.isnumeric()]
+            args = self._lettered_axes
         for axis in args:
             axis_positions[axis] = 0
         self.set_position(**axis_positions)
@@ -132,9 +161,9 @@ class SimTigerController(TigerController):
         # Fill out all args if none are populated.
         if not args:
             # Default to all lettered axes.
-            args = [ax for ax in self.ordered_axes if not ax.isnumeric()]
+            args = self._lettered_axes
         axes_positions = [self.sim_positions[ax] for ax  in args]
-        return {k: v for k, v in zip(args, axes_positions)}
+        return dict(zip(args, axes_positions))
 
     def set_speed(self, wait: bool = True, **axes: float):
         self.sim_speeds.update(**axes)
@@ -143,6 +172,9 @@ class SimTigerController(TigerController):
 
     @axis_check()
     def get_speed(self, *axes: str):
+        # Bypass the parent's reply cache so the faked reply pushed below is
+        # always consumed.
+        self._speed_cache.clear()
         speed_settings = "".join([f" {x}={round(self.sim_speeds[x], MM_SCALE)}"
                                   for x in axes])
         msg = f"{ACK} {speed_settings}\r\n".encode('ascii')
@@ -156,6 +188,10 @@ class SimTigerController(TigerController):
         """blocks. True if any axes is moving. False otherwise."""
         return False
 
+    def is_moving_nowait(self):
+        """Non-blocking variant. Simulated axes are never moving."""
+        return False
+
     def get_build_config(self):
         """return the configuration of the Tiger Controller.
 
@@ -194,6 +230,7 @@ class SimTigerController(TigerController):
     def clear_incoming_message_queue(self):
         """Clear input buffer and reset skipped replies."""
         self.skipped_replies = 0
+        self._status_pending = False
 
     @axis_check('wait')
     def get_etl_temp(self, axis: str, wait: bool = True):
@@ -1,11 +1,17 @@
 """TigerController Serial Port Abstraction"""
+from contextlib import contextmanager
 from enum import Enum
 from serial import Serial, SerialException
-from functools import cache, wraps
+from functools import cache, lru_cache, wraps
 from time import sleep, perf_counter
 from tigerasi.device_codes import *
 from typing import Union
 import logging
+import re
+try:
+    import termios  # POSIX-only; used to flush both buffers in one syscall.
+except ImportError:
+    termios = None
 
 # Constants
 STEPS_PER_UM = 10.0  # multiplication constant to convert micrometers to steps.
@@ -16,8 +22,32 @@ DEFAULT_SPEED_PERCENT = 67.0
 DEFAULT_SPEED_MM_PER_SEC = 7.68 * 67.0
 REPLY_WAIT_TIME_S = 0.020  # minimum time to wait for a reply after having
                            # sent a command.
+SPEED_CACHE_TTL_S = 0.25  # time window in which a get_speed reply stays
+                          # fresh. Speed only changes via set_speed, which
+                          # invalidates the cache outright.
 GET_INFO_STRING_SPLIT = 33 # index to split get info string reply
 
+# Precompiled patterns for parsing axis replies in one C-level scan.
+AXIS_VALUE_PATTERN = re.compile(r"([A-Z0-9])=(-?\d+\.?\d*)")
+NUMBER_PATTERN = re.compile(r"-?\d+\.?\d*")
+
+# Precomputed lookup so reply error checking is a dict probe, not an enum
+# construction with a caught ValueError.
+ERROR_CODE_MAP = {e.value: e for e in ErrorCodes}
+
+# Commands pre-terminated with '\r' so parameterless sends (HALT, PZINFO,
+# etc.) skip the per-call concatenation.
+TERMINATED_CMDS = {cmd: cmd.value + '\r' for cmd in Cmds}
+
+
+@lru_cache(maxsize=64)
+def _kwds_template(keys: tuple) -> str:
+    """Return a %-style parameter suffix (``' X=%s Y=%s'``) for a kwarg-key
+    shape. Callers tend to reuse the same axis set over and over (e.g. a
+    move loop on one axis), so the uppercasing and string assembly happen
+    once per shape instead of once per call."""
+    return "".join(f" {k.upper()}=%s" for k in keys)
+
 
 # Decorators
 def axis_check(*args_to_skip: str):
@@ -31,12 +61,14 @@ def axis_check(*args_to_skip: str):
             # Sanitize input to all-uppercase. Filter out specified parameters.
             args = [a.upper() for a in args if a not in args_to_skip]
             kwds = {k.upper(): v for k, v in kwds.items() if k not in args_to_skip}
-            # Combine args and kwd names; skip double-adding params specified
-            # as one or the other.
-            iterable = [a for a in args if a not in kwds] + list(kwds.keys())
-            for arg in iterable:
-                assert arg.upper() in self.axes, \
-                    f"Error. Axis '{arg.upper()}' does not exist"
+            # Single set-difference membership test instead of a per-arg loop.
+            # Skipped entirely under `python -O`, when there is nothing to
+            # validate, or when the caller opted out via skip_axis_validation.
+            if __debug__ and (args or kwds) and not self.skip_axis_validation:
+                bad_axes = set(args).union(kwds).difference(self.axes)
+                if bad_axes:
+                    raise ValueError(f"Error. Axes {sorted(bad_axes)} "
+                                     f"do not exist.")
             return func(self, *args, **kwds)
         return inner
     return wrap
@@ -64,6 +96,13 @@ class TigerController:
     # Constants
     BAUD_RATE = 115200
     TIMEOUT = 1
+    # Precomputed command for the hot motion-polling path, also kept in
+    # encoded form so polls run with no per-call allocations.
+    _STATUS_CMD = Cmds.STATUS.value + '\r'
+    _STATUS_CMD_BYTES = _STATUS_CMD.encode('ascii')
+    # The only two well-formed STATUS replies.
+    _STATUS_MOVING_REPLY = b'B\r\n'
+    _STATUS_IDLE_REPLY = b'N\r\n'
 
     def __init__(self, com_port: str):
         """Init. Creates serial port connection and connects to hardware.
@@ -78,11 +117,40 @@ class TigerController:
         self.ser = None
         self.log = logging.getLogger(__name__)
         self.skipped_replies = 0
+        self._status_pending = False  # STATUS sent; reply not yet read.
+        self._pipeline_parts = None  # buffered commands inside pipelined().
+        self._rx_buf = bytearray()  # leftover bytes from bulk reply reads.
+        self._speed_cache = {}  # axes tuple -> (expiry time, speed dict).
+        # Trusted callers in tight control loops may set this True to skip
+        # per-call axis validation (uppercasing still applies).
+        self.skip_axis_validation = False
         try:
             self.ser = Serial(com_port, TigerController.BAUD_RATE,
                               timeout=TigerController.TIMEOUT)
-            self.ser.reset_input_buffer()
-            self.ser.reset_output_buffer()
+            # Flush both directions in one tcflush syscall where the port
+            # exposes a POSIX fd; otherwise (Windows, ports without a real
+            # fd) fall back to pyserial's per-direction resets.
+            try:
+                termios.tcflush(self.ser.fileno(), termios.TCIOFLUSH)
+            except (AttributeError, OSError):
+                self.ser.reset_input_buffer()
+                self.ser.reset_output_buffer()
+            # Request low-latency mode so USB-serial adapters (FTDI et al)
+            # deliver replies immediately instead of waiting out their
+            # default ~16[ms] latency timer. Best-effort: not all platforms
+            # and drivers support it.
+            try:
+                self.ser.set_low_latency_mode(True)
+            except (NotImplementedError, ValueError, OSError):
+                self.log.debug("Serial port low-latency mode is unsupported "
+                               "on this platform/driver.")
+            # Request bigger OS buffers so bursts of replies (multi-line
+            # queries, pipelined commands) never overflow. Windows-only
+            # pyserial API; harmless to skip elsewhere.
+            try:
+                self.ser.set_buffer_size(rx_size=16384, tx_size=16384)
+            except (AttributeError, OSError):
+                pass
         except SerialException as e:
             logging.error("Error: could not open connection to Tiger "
                   "Controller. Is the device plugged in? Is another program "
@@ -100,12 +168,18 @@ class TigerController:
                               self._get_card_modules(self.axis_to_card[x][0])
                               for x in self.ordered_axes}
         ## FW-1000 filter wheels have their own command set but show up in
-        # axis list as '0', '1' etc, so we remove them..
-        self.ordered_filter_wheels = [fw for fw in self.ordered_axes if fw.isnumeric()]
-        self.ordered_axes = [ax for ax in self.ordered_axes if not ax.isnumeric()]
+        # axis list as '0', '1' etc, so we split them out in a single pass.
+        self.ordered_filter_wheels = []
+        lettered_axes = []
+        for ax in self.ordered_axes:
+            (self.ordered_filter_wheels if ax.isnumeric()
+             else lettered_axes).append(ax)
+        self.ordered_axes = lettered_axes
         # print(f"ordered axes are: {self.ordered_axes}")
+        # Prebuilt default for methods that act on all lettered axes.
+        self._lettered_axes = tuple(self.ordered_axes)
         # Create O(1) lookup container.
-        self.axes = set(self.ordered_axes)
+        self.axes = frozenset(self.ordered_axes)
 
         # Internal State Tracking to issue moves correctly.
         self._scan_card_addr = None  # card address on which the scan axes exist.
@@ -138,6 +212,72 @@ class TigerController:
         # Save the most recent MOVEREL axes to properly issue the TTL cmd.
         self._last_rel_move_axes = [x for x in axes if x in self.axes]
 
+    def move_axis_relative(self, axis: str, val: int, wait: bool = True):
+        """Single-axis fast path for :meth:`move_relative`.
+
+        Skips the kwargs packing, decorator dispatch, and template lookup
+        that the general method pays — worthwhile in tight stepping loops
+        that always move the same one axis.
+
+        :param axis: the axis to move.
+        :param val: the relative position (in steps) to move to.
+        :param wait: wait until the reply has been received.
+
+        .. code-block:: python
+
+            box.move_axis_relative('z', 11)
+
+        """
+        axis = axis.upper()
+        if __debug__ and axis not in self.axes:
+            raise ValueError(f"Error. Axis '{axis}' does not exist.")
+        self.send(f"{Cmds.MOVEREL.value} {axis}={val}\r", wait=wait)
+        # Save the most recent MOVEREL axes to properly issue the TTL cmd.
+        self._last_rel_move_axes = [axis]
+
+    def make_specialized_move(self, *axes: str, relative: bool = True):
+        """Return a mover function specialized for a fixed set of axes.
+
+        Axis validation, uppercasing, and command-template assembly happen
+        once here; the returned function only formats the step values into
+        the precomputed template (a C-level ``%`` substitution) and sends.
+        Intended for control loops that move the same axes at maximum rate.
+
+        :param axes: one or more axes the returned function will move.
+        :param relative: move by a relative amount (MOVEREL) if True;
+            otherwise move to an absolute position (MOVE).
+        :return: a function taking one positional step value (in tenths of
+            microns) per axis, plus an optional ``wait`` keyword.
+
+        .. code-block:: python
+
+            move_z = box.make_specialized_move('z')
+            for _ in range(1000):
+                move_z(11)  # equivalent to box.move_relative(z=11)
+
+        """
+        axes = tuple(ax.upper() for ax in axes)
+        if __debug__:
+            bad_axes = set(axes).difference(self.axes)
+            if bad_axes:
+                raise ValueError(f"Error. Axes {sorted(bad_axes)} "
+                                 f"do not exist.")
+        cmd = Cmds.MOVEREL if relative else Cmds.MOVEABS
+        template = cmd.value + "".join(f" {ax}=%s" for ax in axes) + '\r'
+        send = self.send  # Prebind to skip the attribute lookup per call.
+        if not relative:
+            def move(*steps, wait: bool = True):
+                send(template % steps, wait=wait)
+        else:
+            # Shared (not rebuilt per call) list of the most recent MOVEREL
+            # axes, needed to properly issue the TTL cmd.
+            last_rel_move_axes = list(axes)
+
+            def move(*steps, wait: bool = True):
+                send(template % steps, wait=wait)
+                self._last_rel_move_axes = last_rel_move_axes
+        return move
+
     @axis_check('wait')
     def move_absolute(self, wait: bool = True, **axes: int):
         """move the axes specified by a corresponding absolute amount.
@@ -239,7 +379,7 @@ class TigerController:
         # TODO: what happens if we home a device with CLOCKED POSITIONS?
         axis_positions = {}
         if not axes:  # Default to all lettered axes if none are specified.
-            axes = [ax for ax in self.ordered_axes if not ax.isnumeric()]
+            axes = self._lettered_axes
         for axis in axes:
             axis_positions[axis] = 0
         self.set_position(**axis_positions, wait=wait)
@@ -283,8 +423,8 @@ class TigerController:
 
         """
         axes = [f"{ax}+" for ax in axes]
-        # Round axes values in mm to 4 decimal places.
-        kwd_axes = {x: round(v, MM_SCALE) for x, v in kwd_axes.items()}
+        # Fix axes values to 4 decimal places of mm in one formatting pass.
+        kwd_axes = {x: f"{v:.{MM_SCALE}f}" for x, v in kwd_axes.items()}
         return self._set_cmd_args_and_kwds(Cmds.SETLOW, *axes, **kwd_axes)
 
     def get_lower_travel_limit(self, *axes: str):
@@ -328,8 +468,8 @@ class TigerController:
 
         """
         axes = [f"{ax}+" for ax in axes]
-        # Round axes values in mm to 4 decimal places.
-        kwd_axes = {x: round(v, MM_SCALE) for x, v in kwd_axes.items()}
+        # Fix axes values to 4 decimal places of mm in one formatting pass.
+        kwd_axes = {x: f"{v:.{MM_SCALE}f}" for x, v in kwd_axes.items()}
         return self._set_cmd_args_and_kwds(Cmds.SETUP, *axes, **kwd_axes)
 
     def get_upper_travel_limit(self, *axes: str):
@@ -397,18 +537,18 @@ class TigerController:
             box.get_position('x', 'y')  # returns: {'X': 10, 'Y': 50}
 
         """
-        axes_str = ""
         # Order the args since the hardware reply arrives in a fixed order.
         axes = self._order_axes(axes)
         if not axes:  # Default to all letter axes if none are specified.
             # Note: numeric (filter wheel) axes would be ignored if we added them.
-            axes = [ax for ax in self.ordered_axes if not ax.isnumeric()]
-        for axis in axes:
-            axes_str += f" {axis.upper()}"
-        cmd_str = Cmds.WHERE.value + axes_str + '\r'
+            axes = self._lettered_axes
+        # _order_axes and ordered_axes are already uppercase; one join builds
+        # the axis list without growing a string per axis.
+        cmd_str = f"{Cmds.WHERE.value} {' '.join(axes)}\r"
         reply = self.send(cmd_str)
-        axes_positions = [float(v) for v in reply.split()[1:]]
-        return {k: v for k, v in zip(axes, axes_positions)}
+        # Positions arrive in axis order after the ack, which holds no
+        # digits; zip/map/float all run in C.
+        return dict(zip(axes, map(float, NUMBER_PATTERN.findall(reply))))
 
     @axis_check('wait')
     def set_speed(self, wait: bool = True, **axes: float):
@@ -424,8 +564,9 @@ class TigerController:
             box.set_speed(x=50.5, y=10)
 
         """
-        # Round axes values in mm to 4 decimal places.
-        axes = {x: round(v, MM_SCALE) for x, v in axes.items()}
+        self._speed_cache.clear()  # Cached speeds are now stale.
+        # Fix axes values to 4 decimal places of mm in one formatting pass.
+        axes = {x: f"{v:.{MM_SCALE}f}" for x, v in axes.items()}
         self._set_cmd_args_and_kwds(Cmds.SPEED, **axes, wait=wait)
 
     @axis_check()
@@ -433,6 +574,11 @@ class TigerController:
         """return the speed from the specified axis in [mm/s] or all axes if
         none are specified.
 
+        Note: replies are cached for a short window
+        (:data:`SPEED_CACHE_TTL_S`), since speed only changes through
+        :meth:`set_speed`, which invalidates the cache. Polling loops that
+        re-read speed within the window skip the serial round-trip.
+
         :param axes: one or more lettered axes (case insensitive).
         :return: speed of requested axes in dict form (upper case).
 
@@ -441,7 +587,13 @@ class TigerController:
             box.get_speed('x', 'z')  # returns: {'X': 50.5, 'Y': 10}
 
         """
-        return self._get_axis_value(Cmds.SPEED, *axes)
+        now = perf_counter()
+        hit = self._speed_cache.get(axes)
+        if hit is not None and now < hit[0]:
+            return dict(hit[1])
+        speeds = self._get_axis_value(Cmds.SPEED, *axes)
+        self._speed_cache[axes] = (now + SPEED_CACHE_TTL_S, dict(speeds))
+        return speeds
 
     @axis_check('wait')
     def set_acceleration(self, **axes: float):
@@ -457,8 +609,8 @@ class TigerController:
             box.set_acceleration(x=100, y=70)
 
         """
-        # Round axes values in ms to 0 decimal places.
-        axes = {x: round(v, MS_SCALE) for x, v in axes.items()}
+        # Fix axes values to whole ms in one formatting pass.
+        axes = {x: f"{v:.{MS_SCALE}f}" for x, v in axes.items()}
         self._set_cmd_args_and_kwds(Cmds.ACCEL, **axes)
 
     @axis_check()
@@ -601,11 +753,13 @@ class TigerController:
         axis_str = f" {axis.upper()}?"
         cmd_str = Cmds.CNTS.value + axis_str + '\r'
         reply = self.send(cmd_str)
-        return float(reply.split('=')[-1].split()[0])
+        # rpartition returns a fixed 3-tuple; no intermediate token list.
+        return float(reply.rpartition('=')[2].split(None, 1)[0])
 
     # TODO: consider making this function a hidden function that only gets
     #  called when a particular tigerbox command needs an axis specified by id.
     @axis_check()
+    @cache
     def get_axis_id(self, axis: str):
         """Get the hardware's axis id for a given axis.
 
@@ -616,7 +770,7 @@ class TigerController:
         """
         cmd_str = Cmds.Z2B.value + f" {axis.upper()}?" + '\r'
         reply = self.send(cmd_str)
-        return int(reply.split('=')[-1])
+        return int(reply.rpartition('=')[2])
 
     @axis_check('wait')
     def set_axis_control_mode(self, wait: bool = True,
@@ -746,10 +900,10 @@ class TigerController:
                            f"spacing: {rounded_pulse_interval_um:.1f}[um].")
         # Parameter setup.
         kwds = {
-            'X': round(scan_start_mm, MM_SCALE),
+            'X': f"{scan_start_mm:.{MM_SCALE}f}",
             'Z': pulse_interval_enc_ticks}
         if scan_stop_mm is not None:
-            kwds['Y'] = round(scan_stop_mm, MM_SCALE)
+            kwds['Y'] = f"{scan_stop_mm:.{MM_SCALE}f}"
         if num_pixels is not None:
             kwds['F'] = num_pixels
         if retrace_speed_percent is not None:
@@ -788,13 +942,13 @@ class TigerController:
                                "apply the sttings. setup_scan must be run "
                                "first.")
         kwds = {
-            'X': round(scan_start_mm, MM_SCALE),
-            'Y': round(scan_stop_mm, MM_SCALE),
+            'X': f"{scan_start_mm:.{MM_SCALE}f}",
+            'Y': f"{scan_stop_mm:.{MM_SCALE}f}",
             'Z': line_count}
         if overshoot_time_ms is not None:
             kwds['F'] = round(overshoot_time_ms)
         if overshoot_factor is not None:
-            kwds['T'] = round(overshoot_factor, MM_SCALE)
+            kwds['T'] = f"{overshoot_factor:.{MM_SCALE}f}"
         self._set_cmd_args_and_kwds(Cmds.SCANV, **kwds, wait=wait,
                                     card_address=self._scan_card_addr)
 
@@ -877,18 +1031,18 @@ class TigerController:
         # Set start position.
         start_position = {}
         if x_start_mm is not None:
-            start_position['X'] = round(x_start_mm, MM_SCALE)
+            start_position['X'] = f"{x_start_mm:.{MM_SCALE}f}"
         if y_start_mm is not None:
-            start_position['Y'] = round(y_start_mm, MM_SCALE)
+            start_position['Y'] = f"{y_start_mm:.{MM_SCALE}f}"
         self._set_cmd_args_and_kwds(Cmds.AHOME, **start_position, wait=wait,
                                     card_address=self._array_scan_card_addr)
         # Setup scan.
         scan_params = {
             'X': x_points,
             'Y': y_points,
-            'Z': round(delta_x_mm, MM_SCALE),
-            'F': round(delta_y_mm, MM_SCALE),
-            'T': round(theta_deg, DEG_SCALE)}
+            'Z': f"{delta_x_mm:.{MM_SCALE}f}",
+            'F': f"{delta_y_mm:.{MM_SCALE}f}",
+            'T': f"{theta_deg:.{DEG_SCALE}f}"}
         self._set_cmd_args_and_kwds(Cmds.ARRAY, **scan_params, wait=wait,
                                     card_address=self._array_scan_card_addr)
 
@@ -1034,16 +1188,22 @@ class TigerController:
                                   aux_io_state = 0, aux_io_mask = 0, aux_io_mode = 0)
 
         """
-        in0_str = f" X={in0_mode.value} " if in0_mode is not None else ""
-        out0_str = f" Y={out0_mode.value} " if out0_mode is not None else ""
-        auxstate_str = f" Z={aux_io_state} " if aux_io_state is not None else ""
-        polarity_str = f" F={-1 if reverse_output_polarity else 1} " \
-            if reverse_output_polarity is not None else ""
-        auxmask_str = f" R={aux_io_mask} " if aux_io_mask is not None else ""
-        auxmode_str = f" T={aux_io_mode} " if aux_io_mode is not None else ""
-        # Aggregate specified params.
-        param_str = f"{in0_str}{out0_str}{auxstate_str}{polarity_str}" \
-                    f"{auxmask_str}{auxmode_str}".rstrip()
+        # Aggregate specified params; one join instead of growing a string
+        # per parameter.
+        params = []
+        if in0_mode is not None:
+            params.append(f"X={in0_mode.value}")
+        if out0_mode is not None:
+            params.append(f"Y={out0_mode.value}")
+        if aux_io_state is not None:
+            params.append(f"Z={aux_io_state}")
+        if reverse_output_polarity is not None:
+            params.append(f"F={-1 if reverse_output_polarity else 1}")
+        if aux_io_mask is not None:
+            params.append(f"R={aux_io_mask}")
+        if aux_io_mode is not None:
+            params.append(f"T={aux_io_mode}")
+        param_str = " ".join(params)
         # Infer address of card or cards for a repeated move.
         if in0_mode == TTLIn0Mode.REPEAT_LAST_REL_MOVE and card_address is None:
             cards = {self.axis_to_card[x][0] for x in self._last_rel_move_axes}
@@ -1104,8 +1264,103 @@ class TigerController:
         return bool(int(reply.lstrip(':A ')))
 
     def is_moving(self):
-        """True if any axes is moving. False otherwise. Blocks."""
-        return self.are_axes_moving()
+        """True if any axes is moving. False otherwise. Blocks. Implements
+        `STATUS <http://asiimaging.com/docs/products/serial_commands#commandstatus>`_
+        command."""
+        # Wait at least 20[ms] following the last time we sent a command.
+        # (Handles edge case where the last command was sent with wait=False.)
+        time_since_last_cmd = perf_counter() - self._last_cmd_send_time
+        sleep_time = REPLY_WAIT_TIME_S - time_since_last_cmd
+        if sleep_time > 0:
+            sleep(sleep_time)
+        # STATUS always replies with exactly 3 bytes: 'B\r\n' or 'N\r\n', so
+        # skip the general pipeline and read a fixed-length reply.
+        reply = self._send_fixed_reply(self._STATUS_CMD_BYTES, 3)
+        if reply == self._STATUS_MOVING_REPLY:
+            return True
+        elif reply == self._STATUS_IDLE_REPLY:
+            return False
+        raise RuntimeError(f"Error. Cannot tell if axes are moving. "
+                           f"Received: '{reply}'")
+
+    def is_moving_nowait(self):
+        """Non-blocking variant of :meth:`is_moving`.
+
+        The first call issues the STATUS query and returns immediately;
+        subsequent calls peek at the input buffer and only read the reply
+        once it has fully arrived, so the caller can do useful work between
+        polls instead of blocking on the serial round-trip.
+
+        Note: do not issue other commands between polls, since the pending
+        STATUS reply must be the next reply read back.
+
+        :return: True (moving) or False (idle) once the reply is available,
+            otherwise None.
+        """
+        # If another read path (send, _send_fixed_reply) drained our pending
+        # reply as a skipped one in the meantime, the poll was abandoned:
+        # start a fresh query rather than misreading the next reply.
+        if self._status_pending and not self.skipped_replies:
+            self._status_pending = False
+        if not self._status_pending:
+            # Drain replies skipped by previous wait=False commands so the
+            # next 3 bytes in the buffer belong to our STATUS query.
+            self._drain_skipped_replies()
+            self.log.debug("Sending: %r", self._STATUS_CMD_BYTES)
+            self.ser.write(self._STATUS_CMD_BYTES)
+            self._last_cmd_send_time = perf_counter()
+            self._status_pending = True
+            # Register the in-flight reply so every other read path stays
+            # aligned if the caller never polls again.
+            self.skipped_replies += 1
+        # Reply ('B\r\n' or 'N\r\n') not here yet?
+        if len(self._rx_buf) + self.ser.in_waiting < 3:
+            return None
+        reply = self._read_exact(3)
+        self.log.debug("Reply: %r", reply)
+        self._status_pending = False
+        self.skipped_replies -= 1
+        if reply == self._STATUS_MOVING_REPLY:
+            return True
+        elif reply == self._STATUS_IDLE_REPLY:
+            return False
+        raise RuntimeError(f"Error. Cannot tell if axes are moving. "
+                           f"Received: '{reply}'")
+
+    def move_then_check(self, **axes: int) -> bool:
+        """Issue a relative move without waiting on its reply, then query
+        the motion state.
+
+        Because :meth:`send` tracks skipped replies, the STATUS query goes
+        out while the controller is still emitting the MOVEREL ack, and both
+        replies are read back to back — overlapping two command-processing
+        windows into roughly one round-trip.
+
+        :param axes: one or more axes specified by name where the value is
+            the relative position (in steps) to move to.
+        :return: True if any axis is still moving. False otherwise.
+
+        .. code-block:: python
+
+            while box.move_then_check(z=11):
+                pass  # stage is still stepping.
+
+        """
+        # Assemble the MOVEREL inline and send it with wait=False directly:
+        # the axis_check decorator on move_relative strips the wait kwarg,
+        # so routing through it would block on the ack first and serialize
+        # the two round-trips this method exists to overlap.
+        if __debug__ and not self.skip_axis_validation:
+            bad_axes = {k.upper() for k in axes}.difference(self.axes)
+            if bad_axes:
+                raise ValueError(f"Error. Axes {sorted(bad_axes)} "
+                                 f"do not exist.")
+        cmd_str = Cmds.MOVEREL.value \
+            + _kwds_template(tuple(axes)) % tuple(axes.values()) + '\r'
+        self.send(cmd_str, wait=False)
+        # Save the most recent MOVEREL axes to properly issue the TTL cmd.
+        self._last_rel_move_axes = [k.upper() for k in axes]
+        return self.is_moving()
 
     def is_axis_moving(self, axis: str):
         """True if the specified axis is moving. False otherwise. Blocks."""
@@ -1125,7 +1380,7 @@ class TigerController:
         if sleep_time > 0:
             sleep(sleep_time)
         if not axes:  # Default to all lettered axes if none are specified.
-            axes = [x for x in self.ordered_axes if not x.isnumeric()]
+            axes = self._lettered_axes
         axes_str = ''.join([f" {x.upper()}?" for x in axes])
         # Send the inquiry. Handle: ":A \r\n" and ":A\r\n" and remove ":A " from reply
         reply = self.send(f"{Cmds.RDSTAT.value + axes_str}\r").rstrip().rstrip('\r\n').lstrip(ACK).lstrip()
@@ -1158,7 +1413,100 @@ class TigerController:
     def clear_incoming_message_queue(self):
         """Clear input buffer and reset skipped replies."""
         self.skipped_replies = 0
-        self.ser.reset_input_buffer()
+        # Any in-flight STATUS reply is discarded with the buffer, so the
+        # next is_moving_nowait() must issue a fresh query.
+        self._status_pending = False
+        self._rx_buf.clear()
+        # Read-and-discard whatever is queued rather than issuing a purge
+        # ioctl (PurgeComm/tcflush) per call.
+        try:
+            while self.ser.in_waiting:
+                self.ser.read(self.ser.in_waiting)
+        except AttributeError:  # Backend without in_waiting support.
+            self.ser.reset_input_buffer()
+
+    def _read_line(self, terminator: bytes = b'\r\n') -> bytes:
+        """Read one reply line (terminator included).
+
+        Pulls whatever the port has queued in bulk and scans for the
+        terminator with C-level ``find`` instead of pyserial's
+        byte-at-a-time ``read_until`` loop. Surplus bytes stay buffered for
+        the next read.
+        """
+        buf = self._rx_buf
+        while True:
+            idx = buf.find(terminator)
+            if idx != -1:
+                end = idx + len(terminator)
+                line = bytes(buf[:end])
+                del buf[:end]
+                return line
+            chunk = self.ser.read(self.ser.in_waiting or 1)
+            if not chunk:  # Timed out: return the partial line, as
+                line = bytes(buf)  # read_until would.
+                buf.clear()
+                return line
+            buf += chunk
+
+    def _read_exact(self, reply_len: int) -> bytes:
+        """Read exactly `reply_len` reply bytes (fewer on timeout)."""
+        buf = self._rx_buf
+        while len(buf) < reply_len:
+            chunk = self.ser.read(self.ser.in_waiting or 1)
+            if not chunk:  # Timed out.
+                break
+            buf += chunk
+        reply = bytes(buf[:reply_len])
+        del buf[:reply_len]
+        return reply
+
+    def _drain_skipped_replies(self):
+        """Read and discard queued replies from commands sent with
+        ``wait=False``, raising if any of them carries an error code (the
+        same policy :meth:`send` applies to skipped replies)."""
+        while self.skipped_replies:
+            reply = self._read_line().decode('ascii')
+            # Decrement first so the counter stays aligned if we raise.
+            self.skipped_replies -= 1
+            self.check_reply_for_errors(reply)
+
+    @contextmanager
+    def pipelined(self):
+        """Batch all commands issued inside the block into a single write.
+
+        On exit, the buffered commands go out as one serial write and their
+        replies are drained and error-checked in order — one write and one
+        reply-drain pass for N commands instead of N of each.
+
+        Note: replies are not available until the block exits, so only
+        fire-and-forget commands (setters) may be issued inside the block.
+        A raw :meth:`send` returns ``None``; getters (:meth:`get_position`,
+        :meth:`get_speed`, etc.) would try to parse that ``None`` and raise.
+
+        .. code-block:: python
+
+            with box.pipelined():
+                box.set_speed(x=10)
+                box.set_axis_backlash(x=0.05)
+                box.set_position(z=0)
+
+        """
+        if self._pipeline_parts is not None:
+            raise RuntimeError("pipelined() blocks cannot be nested.")
+        self._pipeline_parts = []
+        try:
+            yield
+            parts, self._pipeline_parts = self._pipeline_parts, None
+            if not parts:
+                return
+            self.ser.write(b''.join(parts))
+            self._last_cmd_send_time = perf_counter()
+            for _ in parts:
+                reply = self._read_line().decode('ascii')
+                self.log.debug("Reply: %r", reply)
+                self.check_reply_for_errors(reply)
+        finally:
+            self._pipeline_parts = None
 
     # Low-Level Commands.
     def send(self, cmd_str: str, read_until: str = "\r\n", wait: bool = True):
@@ -1170,16 +1518,26 @@ class TigerController:
             filter wheels have a different response termination.)
         :param wait: wait until the reply has been received.
         """
+        # Inside a pipelined() block, buffer the command for one big write.
+        if self._pipeline_parts is not None:
+            self.log.debug("Buffering: %r", cmd_str)
+            self._pipeline_parts.append(cmd_str.encode('ascii'))
+            return
         wait_for_output = wait  # wait for outgoing bytest to exit the PC.
         wait_for_reply = wait  # wait until at least one line has been read back.
         # TODO: clear input buffer before issuing a read-and-wait if the
         #  recv buffer is full. Use in_waiting.
-        self.log.debug(f"Sending: {repr(cmd_str)}")
+        # f-strings evaluate eagerly, so skip building them when debug
+        # logging is off (the typical production case).
+        log_debug = self.log.isEnabledFor(logging.DEBUG)
+        if log_debug:
+            self.log.debug("Sending: %r", cmd_str)
         self.ser.write(cmd_str.encode('ascii'))
         self._last_cmd_send_time = perf_counter()
         if wait_for_output:  # Wait for all bytes to exit the output buffer.
-            while self.ser.out_waiting:
-                pass
+            # flush() blocks in the OS until the TX buffer drains instead of
+            # spinning the interpreter on out_waiting.
+            self.ser.flush()
         # If we do not wait for a reply, we must track how many replies to read later.
         if not wait_for_reply:
             self.skipped_replies += 1
@@ -1191,9 +1549,11 @@ class TigerController:
         # FIXME: it is possible to overflow the buffer if we don't read enough.
         # Note: reading at least one reply out of the buffer costs ~0.01[s]
         while True:
+            # Replies are pure ASCII, so take the cheapest decode path.
             reply = \
-                self.ser.read_until(read_until.encode("ascii")).decode("utf8")
-            self.log.debug(f"Reply: {repr(reply)}")
+                self._read_line(read_until.encode("ascii")).decode("ascii")
+            if log_debug:
+                self.log.debug("Reply: %r", reply)
             try:
                 self.check_reply_for_errors(reply)
             except SyntaxError as e:  # Technically, this could be a skipped reply.
@@ -1206,6 +1566,27 @@ class TigerController:
                 break
         return reply
 
+    def _send_fixed_reply(self, cmd_bytes: bytes, reply_len: int) -> bytes:
+        """Send a pre-encoded command whose reply length is known ahead of
+        time and return the raw reply bytes.
+
+        Bypasses the byte-at-a-time terminator scan in
+        :meth:`serial.Serial.read_until` by requesting the exact reply size
+        in one read.
+
+        :param cmd_bytes: encoded command with the proper line termination.
+        :param reply_len: exact number of bytes in the expected reply.
+        """
+        self.log.debug("Sending: %r", cmd_bytes)
+        self.ser.write(cmd_bytes)
+        self._last_cmd_send_time = perf_counter()
+        # Drain replies skipped by previous wait=False commands so that the
+        # fixed-length read lines up with this command's reply.
+        self._drain_skipped_replies()
+        reply = self._read_exact(reply_len)
+        self.log.debug("Reply: %r", reply)
+        return reply
+
     def get_info(self, axis: str):
         """Get the hardware's axis info for a given axis. Implements
         `INFO <https://asiimaging.com/docs/commands/info>`_ command.
@@ -1258,9 +1639,13 @@ class TigerController:
                 temp = words[words.find('[')+1:words.find(']')]
         return temp
 
+    @cache
     def get_build_config(self):
         """return the configuration of the Tiger Controller.
 
+        Note: the result is cached since the hardware configuration cannot
+        change while connected.
+
         :return: a dict that looks like:
 
         .. code-block:: python
@@ -1332,14 +1717,15 @@ class TigerController:
     def _order_axes(self, axes: tuple[str]) -> list[str]:
         """return axes in the order they are received in replies from tigerbox.
         """
-        axes = [ax.upper() for ax in axes]
-        return [ax for ax in self.ordered_axes if ax in axes]
+        wanted = {ax.upper() for ax in axes}
+        return [ax for ax in self.ordered_axes if ax in wanted]
 
     def _reset_setting(self, cmd: Cmds, *args, wait: bool = True):
         """Reset a setting that takes an input query with specific syntax."""
-        curr_pos_str = " ".join([f"{a.upper()}-" for a in args])
-        cmd_str = f"{cmd.value} {curr_pos_str}\r"
-        self.send(cmd_str, wait=wait)
+        cmd_str = cmd.value
+        for a in args:
+            cmd_str += f" {a.upper()}-"
+        self.send(cmd_str + '\r', wait=wait)
 
     def _set_cmd_args_and_kwds(self, cmd: Cmds, *args: str, wait: bool = True,
                                card_address: int = None,
@@ -1353,11 +1739,19 @@ class TigerController:
             box._set_cmd_args_and_kwds(Cmds.SETHOME, y=10, z=20.5)
 
         """
-        card_addr_str = f"{card_address}" if card_address is not None else ""
-        args_str = "".join([f" {a.upper()}" for a in args])
-        kwds_str = "".join([f" {a.upper()}={v}" for a, v in kwds.items()])
-        cmd_str = f"{card_addr_str}{cmd.value}{args_str}{kwds_str}\r"
-        return self.send(cmd_str, wait=wait)
+        # Build the command in a single pass to avoid creating throwaway
+        # lists for the typical 1-3 axis case.
+        if card_address is None and not args and not kwds:
+            # Parameterless commands ship pre-terminated.
+            return self.send(TERMINATED_CMDS[cmd], wait=wait)
+        cmd_str = f"{card_address}{cmd.value}" if card_address is not None \
+            else cmd.value
+        for a in args:
+            cmd_str += f" {a.upper()}"
+        if kwds:
+            # One cached template per kwarg-key shape; '%' formats in C.
+            cmd_str += _kwds_template(tuple(kwds)) % tuple(kwds.values())
+        return self.send(cmd_str + '\r', wait=wait)
 
     def _get_axis_value(self, cmd: Cmds, *axes: str):
         """Get the value from one or more axes.
@@ -1367,13 +1761,15 @@ class TigerController:
         :param cmd: a tigerbox command
         :param axes: one or more axis names (case-insensitive)
         """
-        axes_str = " ".join([f"{a.upper()}?" for a in axes])
-        cmd_str = f"{cmd.value} {axes_str}\r"
-        # Trim the acknowledgement part of the response, which could show up at
-        # the beginning or end, depending on the command.
-        reply = self.send(cmd_str).rstrip("\r\n").strip(ACK).split()
-        axis_val_tuples = [c.split("=") for c in reply]
-        return {w[0].upper(): float(w[1]) for w in axis_val_tuples}
+        cmd_str = cmd.value
+        for a in axes:
+            cmd_str += f" {a.upper()}?"
+        cmd_str += '\r'
+        # One compiled-regex scan pulls out the <axis>=<value> pairs; the
+        # acknowledgement token (at the beginning or end, depending on the
+        # command) never matches that shape, so no trimming is needed.
+        reply = self.send(cmd_str)
+        return {k: float(v) for k, v in AXIS_VALUE_PATTERN.findall(reply)}
 
     def _get_card_modules(self, card_address):
         modules = []
@@ -1407,22 +1803,23 @@ class TigerController:
     @staticmethod
     def check_reply_for_errors(reply: str):
         """Check if reply contains an error code; returns None or throws exception."""
-        error_enum = None
-        try:
-            # throws a value error on failure
-            error_enum = ErrorCodes(reply.rstrip('\r\n'))
+        # Fast path: every error code starts with ':N-'. Normal replies skip
+        # the lookup entirely.
+        if not reply.startswith(':N-'):
+            return
+        error_enum = ERROR_CODE_MAP.get(reply.rstrip('\r\n'))
+        if error_enum is not None:
             raise SyntaxError(f"Error. TigerController replied with error "
                               f"code: {str(error_enum)}.")
-        except ValueError:
-            pass
 
     @staticmethod
     def _reply_to_dict(reply):
         dict_reply = {}
-        for line in reply.split('\r'):
-            words = line.split(':')
-            if len(words) == 2:
-                val = words[1].split()
-                dict_reply[words[0]] = val
+        # partition returns a fixed 3-tuple instead of allocating a list per
+        # line. Lines without exactly one ':' are ignored, as before.
+        for line in reply.splitlines():
+            key, sep, rest = line.partition(':')
+            if sep and ':' not in rest:
+                dict_reply[key] = rest.split()
         return dict_reply
 